@@ -1,6 +1,7 @@
 import argparse
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Parse arguments
 parser = argparse.ArgumentParser()
@@ -8,19 +9,33 @@ parser.add_argument('-f', '--force', action='store_true', help="overwrite existi
 force = parser.parse_args().force
 
 # Make sure we're in the right directory
-snapshots_dir = os.path.dirname(__file__)
+snapshots_dir = os.path.dirname(os.path.abspath(__file__))
 assert(os.path.basename(snapshots_dir) == "snapshots")
 os.chdir(snapshots_dir)
 
-# Pack each directory into a zip with the same name
-for entry_name in os.listdir("."):
-    if not os.path.isdir(entry_name): continue
+def pack(entry_name):
+    # 7-zip must be on PATH
+    command = ["7z", "a", f"{entry_name}.7z", f"./{entry_name}/*", "-mtc", "-mtm", "-mta"]
+    return subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+# Find the directories that need to be packed
+with os.scandir(".") as scan:
+    entries = list(scan)
+existing_files = {entry.name for entry in entries if entry.is_file()}
+
+entry_names = []
+for entry in entries:
+    if not entry.is_dir(): continue
 
-    archive_name = f"{entry_name}.7z"
-    if os.path.isfile(archive_name):
+    archive_name = f"{entry.name}.7z"
+    if archive_name in existing_files:
         if not force: continue
         os.remove(archive_name)
 
-    # 7-zip must be on PATH
-    command = f"7z a {entry_name} ./{entry_name}/* -mtc -mtm -mta"
-    subprocess.run(command, shell=True)
+    entry_names.append(entry.name)
+
+# Pack each directory into a zip with the same name. The directories are independent, so they
+# can be packed concurrently. Output is captured and printed in order to keep it readable.
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+    for result in executor.map(pack, entry_names):
+        print(result.stdout, end="")
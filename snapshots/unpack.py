@@ -1,7 +1,9 @@
 import argparse
 import os
 import shutil
+import stat
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Parse arguments
 parser = argparse.ArgumentParser()
@@ -9,23 +11,44 @@ parser.add_argument('-f', '--force', action='store_true', help="overwrite existi
 force = parser.parse_args().force
 
 # Make sure we're in the right directory
-snapshots_dir = os.path.dirname(__file__)
+snapshots_dir = os.path.dirname(os.path.abspath(__file__))
 assert(os.path.basename(snapshots_dir) == "snapshots")
 os.chdir(snapshots_dir)
 
-# Unpack each 7z archive into a directory with the same name
-for entry_name in os.listdir("."):
-    if not os.path.isfile(entry_name): continue
+def delete_readonly(func, path, _):
+    # git marks object files read-only, which stops rmtree on Windows
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
 
-    dir_name, ext = os.path.splitext(entry_name)
+def unpack(entry_name, dir_name):
+    # 7-zip must be on PATH
+    command = ["7z", "x", entry_name, f"-o{dir_name}"]
+    return subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+# Find the archives that need to be unpacked
+with os.scandir(".") as scan:
+    entries = list(scan)
+existing_dirs = {entry.name for entry in entries if entry.is_dir()}
+
+entry_names = []
+dir_names = []
+for entry in entries:
+    if not entry.is_file(): continue
+
+    dir_name, ext = os.path.splitext(entry.name)
     if ext.lower() != ".7z": continue
 
-    if os.path.isdir(dir_name):
+    if dir_name in existing_dirs:
         if not force: continue
-        shutil.rmtree(dir_name)
-        
+        shutil.rmtree(dir_name, onerror=delete_readonly)
+
     os.mkdir(dir_name)
 
-    # 7-zip must be on PATH
-    command = f"7z x {entry_name} -o{dir_name}"
-    subprocess.run(command, shell=True)
+    entry_names.append(entry.name)
+    dir_names.append(dir_name)
+
+# Unpack each 7z archive into a directory with the same name. The archives are independent, so
+# they can be unpacked concurrently. Output is captured and printed in order to keep it readable.
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+    for result in executor.map(unpack, entry_names, dir_names):
+        print(result.stdout, end="")